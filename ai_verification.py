@@ -1,8 +1,16 @@
 import os
 import logging
-from typing import Tuple
-import re
+from typing import List, Tuple, Union
+from collections import OrderedDict
+import hashlib
+import math
 import random
+import threading
+
+try:
+    import ahocorasick
+except ImportError:  # Declared dependency; without it count_pattern_matches falls back to substring tests
+    ahocorasick = None
 
 # In a production environment, we would use a real transformer model
 # from transformers import AutoTokenizer, AutoModelForSequenceClassification
@@ -15,6 +23,170 @@ logger = logging.getLogger(__name__)
 # Get API key from environment variables
 HUGGINGFACE_API_KEY = os.environ.get("HUGGINGFACE_API_KEY")
 
+# List of patterns often found in misinformation
+MISINFORMATION_PATTERNS = [
+    r"they don't want you to know",
+    r"wake up",
+    r"the truth about",
+    r"what they aren't telling you",
+    r"mainstream media won't report",
+    r"banned information",
+    r"censored",
+    r"secret cure",
+    r"miracle treatment",
+    r"government conspiracy",
+    r"the elites",
+    r"100% proof",
+    r"undeniable evidence",
+    r"shocking truth",
+    r"mind-blowing",
+    r"they've been hiding",
+    r"suppressed knowledge",
+    r"what doctors won't tell you",
+    r"they are lying",
+    r"do your own research",
+    r"cover-up",
+    r"follow the money",
+    r"sheep",
+    r"sheeple",
+    r"fake news media",
+    r"huge scandal",
+    r"bombshell",
+    r"big pharma",
+    r"deep state",
+    r"corrupt officials",
+    r"they hid this",
+    r"open your eyes",
+    r"they deleted this",
+    r"truth bomb",
+    r"stop being blind"
+]
+
+# List of patterns often found in factual information
+FACTUAL_PATTERNS = [
+    r"according to research",
+    r"studies show",
+    r"evidence suggests",
+    r"experts say",
+    r"researchers found",
+    r"data indicates",
+    r"analysis of",
+    r"peer-reviewed",
+    r"published in",
+    r"scientific consensus",
+    r"based on data",
+    r"statistics show",
+    r"research published",
+    r"clinical trials",
+    r"experiment results",
+    r"survey results",
+    r"official statistics",
+    r"multiple sources confirm",
+    r"according to the report",
+    r"verified information",
+    r"fact-checked",
+    r"investigation revealed",
+    r"findings suggest",
+    r"official statement",
+    r"public records show",
+    r"according to documents",
+    r"data collected",
+    r"sources familiar with",
+    r"confirmed by",
+    r"according to officials",
+    r"independently verified",
+    r"research indicates",
+    r"the study concludes"
+]
+
+# Pattern counts used to normalize match scores (both lists are non-empty)
+_N_MISINFO = len(MISINFORMATION_PATTERNS)
+_N_FACTUAL = len(FACTUAL_PATTERNS)
+_MIN_PATTERN_LENGTH = min(len(p) for p in MISINFORMATION_PATTERNS + FACTUAL_PATTERNS)
+
+# Every pattern is a literal phrase, so when pyahocorasick is available both
+# groups are loaded into one Aho-Corasick automaton and found in a single pass
+MISINFO_TAG = 0
+FACTUAL_TAG = 1
+
+def _build_pattern_automaton():
+    """Build an automaton mapping each pattern to its (group tag, pattern index)."""
+    automaton = ahocorasick.Automaton()
+    for tag, patterns in ((MISINFO_TAG, MISINFORMATION_PATTERNS), (FACTUAL_TAG, FACTUAL_PATTERNS)):
+        for index, pattern in enumerate(patterns):
+            automaton.add_word(pattern, (tag, index))
+    automaton.make_automaton()
+    return automaton
+
+PATTERN_AUTOMATON = _build_pattern_automaton() if ahocorasick else None
+
+# Dedicated generator for the confidence jitter
+_rng = random.Random()
+
+# Cache of deterministic classification results for repeated claims
+CLASSIFICATION_CACHE_SIZE = 4096
+CACHE_KEY_MAX_LENGTH = 1024  # Longer texts are keyed by digest instead
+_classification_cache: "OrderedDict[Union[str, bytes], Tuple[str, float]]" = OrderedDict()
+_classification_cache_lock = threading.Lock()
+
+def count_pattern_matches(text_lower: str) -> Tuple[int, int]:
+    """
+    Count the misinformation and factual patterns present in a lowercased text.
+    
+    Each pattern counts once however often it occurs, so repeating a phrase
+    doesn't strengthen the signal.
+    
+    Args:
+        text_lower: The lowercased text to scan
+        
+    Returns:
+        A tuple of (misinfo_count, factual_count)
+    """
+    if PATTERN_AUTOMATON is None:
+        # The patterns are plain substrings, so an `in` test (a C-level search) beats the regex engine
+        misinfo_count = sum(1 for pattern in MISINFORMATION_PATTERNS if pattern in text_lower)
+        factual_count = sum(1 for pattern in FACTUAL_PATTERNS if pattern in text_lower)
+        return misinfo_count, factual_count
+    
+    matched = {value for _, value in PATTERN_AUTOMATON.iter(text_lower)}
+    counts = [0, 0]
+    for tag, _ in matched:
+        counts[tag] += 1
+    return counts[MISINFO_TAG], counts[FACTUAL_TAG]
+
+def _scan(text_lower: str) -> Tuple[int, int, int, int]:
+    """
+    Gather every count the classifier needs from a lowercased text.
+    
+    The text is tokenized once and scanned for patterns once, instead of
+    splitting it separately for the word and vocabulary counts.
+    
+    Args:
+        text_lower: The lowercased text to scan
+        
+    Returns:
+        A tuple of (misinfo_count, factual_count, word_count, unique_words)
+    """
+    misinfo_count, factual_count = count_pattern_matches(text_lower)
+    tokens = text_lower.split()
+    return misinfo_count, factual_count, len(tokens), len(set(tokens))
+
+def _vary_confidence(confidence: float) -> float:
+    """
+    Apply the random variation and bounds shared by every classification.
+    
+    Args:
+        confidence: The deterministic confidence from the pattern analysis
+        
+    Returns:
+        The confidence with small random variation, kept between 0.3 and 0.95
+    """
+    # Add small random variation to prevent uniform scores
+    confidence += _rng.uniform(-0.05, 0.05)
+    
+    # Ensure confidence is within reasonable bounds
+    return max(0.3, min(0.95, confidence))
+
 def classify_text(text: str) -> Tuple[str, float]:
     """
     Classify a text as true, false, or unclear using a pre-trained model.
@@ -33,91 +205,63 @@ def classify_text(text: str) -> Tuple[str, float]:
     # Convert to lowercase for easier pattern matching
     text_lower = text.lower()
     
-    # List of patterns often found in misinformation
-    misinformation_patterns = [
-        r"they don't want you to know",
-        r"wake up",
-        r"the truth about",
-        r"what they aren't telling you",
-        r"mainstream media won't report",
-        r"banned information",
-        r"censored",
-        r"secret cure",
-        r"miracle treatment",
-        r"government conspiracy",
-        r"the elites",
-        r"100% proof",
-        r"undeniable evidence",
-        r"shocking truth",
-        r"mind-blowing",
-        r"they've been hiding",
-        r"suppressed knowledge",
-        r"what doctors won't tell you",
-        r"they are lying",
-        r"do your own research",
-        r"cover-up",
-        r"follow the money",
-        r"sheep",
-        r"sheeple",
-        r"fake news media",
-        r"huge scandal",
-        r"bombshell",
-        r"big pharma",
-        r"deep state",
-        r"corrupt officials",
-        r"they hid this",
-        r"open your eyes",
-        r"they deleted this",
-        r"truth bomb",
-        r"stop being blind"
-    ]
-    
-    # List of patterns often found in factual information
-    factual_patterns = [
-        r"according to research",
-        r"studies show",
-        r"evidence suggests",
-        r"experts say",
-        r"researchers found",
-        r"data indicates",
-        r"analysis of",
-        r"peer-reviewed",
-        r"published in",
-        r"scientific consensus",
-        r"based on data",
-        r"statistics show",
-        r"research published",
-        r"clinical trials",
-        r"experiment results",
-        r"survey results",
-        r"official statistics",
-        r"multiple sources confirm",
-        r"according to the report",
-        r"verified information",
-        r"fact-checked",
-        r"investigation revealed",
-        r"findings suggest",
-        r"official statement",
-        r"public records show",
-        r"according to documents",
-        r"data collected",
-        r"sources familiar with",
-        r"confirmed by",
-        r"according to officials",
-        r"independently verified",
-        r"research indicates",
-        r"the study concludes"
-    ]
-    
-    # Count matches for each type of pattern
-    misinfo_count = sum(1 for pattern in misinformation_patterns if re.search(pattern, text_lower))
-    factual_count = sum(1 for pattern in factual_patterns if re.search(pattern, text_lower))
+    # The pattern analysis is deterministic, so repeated claims are served from the cache
+    classification, confidence = _cached_classification(text_lower)
+    confidence = _vary_confidence(confidence)
+    
+    logger.debug(f"Classification: {classification}, Confidence: {confidence}")
+    
+    return classification, confidence
+    
+def classify_batch(texts: List[str]) -> List[Tuple[str, float]]:
+    """
+    Classify several texts in one call, e.g. when scoring a queue or corpus.
+    
+    Args:
+        texts: The texts to classify
+        
+    Returns:
+        A list of (classification, confidence) tuples in the same order as texts
+    """
+    results = []
+    for text in texts:
+        classification, confidence = _cached_classification(text.lower())
+        results.append((classification, _vary_confidence(confidence)))
+    
+    logger.debug(f"Classified batch of {len(results)} texts")
+    
+    return results
+
+def _classify_core(text_lower: str) -> Tuple[str, float]:
+    """
+    Score a lowercased text against the misinformation and factual patterns.
+    
+    Args:
+        text_lower: The lowercased text to classify
+        
+    Returns:
+        A tuple of (classification, confidence) before random variation and clamping
+    """
+    # Count pattern matches and words in a single sweep over the text
+    return _score(*_scan(text_lower))
+
+def _score(misinfo_count: int, factual_count: int, word_count: int, unique_words: int) -> Tuple[str, float]:
+    """
+    Turn pattern and word counts into a classification and confidence.
     
+    Args:
+        misinfo_count: Number of misinformation pattern matches
+        factual_count: Number of factual pattern matches
+        word_count: Number of words in the text
+        unique_words: Number of distinct words in the text
+        
+    Returns:
+        A tuple of (classification, confidence) before random variation and clamping
+    """
     # Don't just count patterns, also examine text sentiment and structure
     
     # Add random variation to confidence based on word count to simulate more natural variation
     # The more words, the more information we have to analyze
-    word_count = len(text.split())
     word_factor = min(1.0, word_count / 100)  # Tops out at 100 words
     
     # Give significantly more weight to matched patterns - increase impact of matches
@@ -126,15 +270,14 @@ def classify_text(text: str) -> Tuple[str, float]:
     
     # Use exponential scoring for repeated patterns - indicates stronger bias
     # Square root for a non-linear relationship (diminishing returns)
-    misinfo_score_base = misinfo_count / len(misinformation_patterns) if len(misinformation_patterns) > 0 else 0
-    factual_score_base = factual_count / len(factual_patterns) if len(factual_patterns) > 0 else 0
+    misinfo_score_base = misinfo_count / _N_MISINFO
+    factual_score_base = factual_count / _N_FACTUAL
     
     # Apply weights and add exponential component for stronger signal
-    misinfo_score = (misinfo_score_base * misinfo_weight) * (1 + 0.5 * (misinfo_count ** 0.5))
-    factual_score = (factual_score_base * factual_weight) * (1 + 0.5 * (factual_count ** 0.5))
+    misinfo_score = (misinfo_score_base * misinfo_weight) * (1 + 0.5 * math.sqrt(misinfo_count))
+    factual_score = (factual_score_base * factual_weight) * (1 + 0.5 * math.sqrt(factual_count))
     
     # Text complexity analysis (longer texts with varied vocabulary are more nuanced)
-    unique_words = len(set(text_lower.split()))
     complexity_factor = min(1.0, unique_words / 50)  # Tops out at 50 unique words
     
     # Calculate confidence based on multiple factors
@@ -161,18 +304,46 @@ def classify_text(text: str) -> Tuple[str, float]:
             # Some patterns but mixed signals
             confidence = 0.45 - (abs(factual_score - misinfo_score) * 0.1)
     
-    # Add small random variation to prevent uniform scores
-    import random
-    random_factor = random.uniform(-0.05, 0.05)
-    confidence += random_factor
+    return classification, confidence
+
+def _cached_classification(text_lower: str) -> Tuple[str, float]:
+    """
+    Return the deterministic classification for a text, using an LRU cache.
     
-    # Ensure confidence is within reasonable bounds
-    confidence = max(0.3, min(0.95, confidence))
+    Long texts are keyed by a BLAKE2 digest so the cache doesn't hold whole articles.
     
-    logger.debug(f"Classification: {classification}, Confidence: {confidence}")
+    Args:
+        text_lower: The lowercased text to classify
+        
+    Returns:
+        A tuple of (classification, confidence) before random variation and clamping
+    """
+    # Texts shorter than the shortest pattern can't match any of them, so skip
+    # both the scan and the cache
+    if len(text_lower) < _MIN_PATTERN_LENGTH:
+        tokens = text_lower.split()
+        return _score(0, 0, len(tokens), len(set(tokens)))
     
-    return classification, confidence
+    if len(text_lower) > CACHE_KEY_MAX_LENGTH:
+        key = hashlib.blake2b(text_lower.encode(), digest_size=16).digest()
+    else:
+        key = text_lower
     
+    with _classification_cache_lock:
+        cached = _classification_cache.get(key)
+        if cached is not None:
+            _classification_cache.move_to_end(key)
+            return cached
+    
+    result = _classify_core(text_lower)
+    
+    with _classification_cache_lock:
+        _classification_cache[key] = result
+        if len(_classification_cache) > CLASSIFICATION_CACHE_SIZE:
+            _classification_cache.popitem(last=False)
+    
+    return result
+
 def get_huggingface_classification(text: str) -> Tuple[str, float]:
     """
     Use Hugging Face API to classify a text as true, false, or unclear.
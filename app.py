@@ -2,6 +2,8 @@ import os
 import logging
 from flask import Flask, render_template, request, redirect, url_for, flash, session
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.orm import DeclarativeBase
 
 # Configure logging
@@ -29,7 +31,7 @@ app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 db.init_app(app)
 
 # Import routes after app initialization to avoid circular imports
-from models import Claim
+from models import Claim, Source, get_claim_view, get_source_views, upgrade_schema
 from fact_checker import verify_claim
 from ai_verification import classify_text
 
@@ -47,19 +49,13 @@ def verify():
         flash("Please enter a claim or article to verify.", "warning")
         return redirect(url_for("index"))
     
-    # Store in session temporarily to display on results page
-    session['claim_text'] = claim_text
-    
     # Step 1: AI model classification
     ai_classification, ai_confidence = classify_text(claim_text)
-    session['ai_classification'] = ai_classification
-    session['ai_confidence'] = f"{ai_confidence:.1%}"  # Format as percentage
     
     # Step 2: Check against fact-checking sources
     verification_results = verify_claim(claim_text)
-    session['verification_results'] = verification_results
     
-    # Save to database
+    # Save the claim and its sources, remembering the claim id for /results
     try:
         new_claim = Claim(
             text=claim_text,
@@ -67,29 +63,53 @@ def verify():
             ai_confidence=ai_confidence
         )
         db.session.add(new_claim)
+        db.session.flush()  # Assigns new_claim.id for its sources
+        
+        # Insert all sources in one executemany round trip
+        source_rows = [
+            Source.row_from_verification_result(new_claim.id, result)
+            for result in verification_results
+        ]
+        if source_rows:
+            db.session.execute(insert(Source), source_rows)
+        
         db.session.commit()
+        session['claim_id'] = new_claim.id
         flash("Your claim has been verified.", "success")
     except Exception as e:
         logging.error(f"Database error: {e}")
         db.session.rollback()
+        session.pop('claim_id', None)
         flash("There was an issue saving your claim.", "danger")
     
-    return redirect(url_for("results"))
+    # Render the results directly rather than redirecting to /results
+    return render_template(
+        "results.html",
+        claim_text=claim_text,
+        ai_classification=ai_classification,
+        ai_confidence=f"{ai_confidence:.1%}",  # Format as percentage
+        verification_results=verification_results
+    )
 
-@app.route("/results")
-def results():
-    """Display verification results."""
+@app.route("/results", defaults={"claim_id": None})
+@app.route("/results/<int:claim_id>")
+def results(claim_id):
+    """Display the stored verification results for a claim, the latest one by default."""
+    if claim_id is None:
+        claim_id = session.get('claim_id')
+    
     # Check if we have results to display
-    if 'claim_text' not in session:
+    claim = get_claim_view(claim_id) if claim_id is not None else None
+    if claim is None:
         flash("No verification results found.", "warning")
         return redirect(url_for("index"))
     
     return render_template(
         "results.html", 
-        claim_text=session.get('claim_text'),
-        ai_classification=session.get('ai_classification'),
-        ai_confidence=session.get('ai_confidence'),
-        verification_results=session.get('verification_results', [])
+        claim_text=claim.text,
+        ai_classification=claim.ai_classification,
+        ai_confidence=f"{claim.ai_confidence:.1%}",  # Format as percentage
+        verification_results=get_source_views(claim.id)
     )
 
 @app.route("/about")
@@ -107,6 +127,12 @@ def server_error(e):
     """Handle 500 errors."""
     return render_template("500.html"), 500
 
-# Initialize the database
+# Initialize the database, upgrading tables created by older versions
 with app.app_context():
-    db.create_all()
+    try:
+        db.create_all()
+    except (OperationalError, ProgrammingError):
+        # Another process created a table between the check and the CREATE;
+        # the second pass skips it and creates whatever is still missing
+        db.create_all()
+    upgrade_schema()
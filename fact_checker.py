@@ -1,11 +1,13 @@
 import os
 import logging
-import requests
-from typing import List, Dict, Any, Tuple
-import time
-import re
+from typing import List, Dict, Any, Tuple, Set, FrozenSet, Optional
 import json
-from web_scraper import get_website_text_content
+from itertools import product
+
+try:
+    import ahocorasick
+except ImportError:  # Declared dependency; without it detect_topics falls back to substring checks
+    ahocorasick = None
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -27,6 +29,231 @@ FACT_CHECK_DOMAINS = [
 GOOGLE_FACT_CHECK_API_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
 GOOGLE_API_KEY = os.environ.get("GOOGLE_FACT_CHECK_API_KEY")
 
+def _phrases(*parts: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Expand groups of alternatives into every phrase they can form, in order."""
+    return tuple(" ".join(words) for words in product(*parts))
+
+# Keywords (lowercase substrings) that mark each claim topic
+TOPIC_KEYWORDS = {
+    # Fallback guidance topics
+    "health": ("health", "cure", "disease", "treatment", "medicine", "doctor", "vaccine"),
+    "politics": ("politic", "government", "election", "democrat", "republican", "congress", "senate", "president"),
+    # Simulated Google Fact Check API topics
+    "covid": ("vaccine", "covid", "coronavirus", "pandemic"),
+    "climate": ("climate", "global warming", "carbon", "emissions"),
+    "hoax": ("hoax", "fake"),
+    "election": ("election", "voting", "ballot", "fraud"),
+    "election_fraud": ("stole", "stolen", "rigged", "fraud", "illegal votes"),
+    "5g_harm": ("cause", "spread", "covid", "health", "radiation", "danger"),
+    # Simulated fact-check search topics
+    "flat_earth": ("flat earth", "earth is flat"),
+    "chemtrails": ("chemtrail", "chem trail", "chemical spray"),
+    "moon_landing_hoax": _phrases(("moon landing",), ("fake", "hoax", "staged")) + ("never went to the moon",),
+    "alternative_medicine": _phrases(
+        ("natural cure", "essential oil", "alternative medicine"),
+        ("cure", "treat", "heal"),
+        ("cancer", "disease", "illness"),
+    ),
+    "vaccine_microchip": _phrases(
+        ("microchip", "tracker", "tracking device"),
+        ("in", "inside"),
+        ("vaccine", "vaccination"),
+    ),
+}
+
+def _index_keywords() -> Dict[str, FrozenSet[str]]:
+    """Map each keyword to every topic it marks, e.g. "covid" marks "covid" and "5g_harm"."""
+    keyword_topics: Dict[str, FrozenSet[str]] = {}
+    for topic, keywords in TOPIC_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_topics[keyword] = keyword_topics.get(keyword, frozenset()) | {topic}
+    return keyword_topics
+
+_KEYWORD_TOPICS = _index_keywords()
+
+def _build_topic_automaton():
+    """Build an automaton mapping each topic keyword to the topics it marks."""
+    automaton = ahocorasick.Automaton()
+    for keyword, topics in _KEYWORD_TOPICS.items():
+        automaton.add_word(keyword, topics)
+    automaton.make_automaton()
+    return automaton
+
+TOPIC_AUTOMATON = _build_topic_automaton() if ahocorasick else None
+
+def detect_topics(claim_text: str) -> Set[str]:
+    """
+    Label a claim with every topic whose keywords it mentions, in a single scan.
+    
+    Args:
+        claim_text: The text of the claim
+        
+    Returns:
+        The set of topic names found in the claim
+    """
+    claim_lower = claim_text.lower()
+    topics: Set[str] = set()
+    
+    if TOPIC_AUTOMATON is not None:
+        for _, keyword_topics in TOPIC_AUTOMATON.iter(claim_lower):
+            topics |= keyword_topics
+    else:
+        for keyword, keyword_topics in _KEYWORD_TOPICS.items():
+            if keyword in claim_lower:
+                topics |= keyword_topics
+    
+    # "5G" is matched case-sensitively, so it can't share the lowercased scan
+    if "5G" in claim_text:
+        topics.add("5g")
+    
+    return topics
+
+# Canned verification results returned by the simulated lookups. They are
+# shared between calls, so callers must not modify them.
+_HEALTH_GUIDANCE_RESULT = {
+    "source": "National Institutes of Health",
+    "source_url": "https://www.nih.gov/health-information",
+    "title": "Health Information Resources",
+    "claim_date": "2023-11-10",
+    "rating": "Information",
+    "summary": "For health-related claims, consult medical professionals and reliable sources like NIH, CDC, or WHO. Medical information should be based on peer-reviewed research."
+}
+
+_POLITICS_GUIDANCE_RESULT = {
+    "source": "AP Fact Check",
+    "source_url": "https://apnews.com/hub/ap-fact-check",
+    "title": "Political Claim Verification",
+    "claim_date": "2023-10-25",
+    "rating": "Analysis Needed",
+    "summary": "Political claims require careful verification through official government records, non-partisan analysis, and multiple reputable news sources."
+}
+
+_GENERAL_GUIDANCE_RESULT = {
+    "source": "Reuters Fact Check",
+    "source_url": "https://www.reuters.com/fact-check/",
+    "title": "Information Verification Guide",
+    "claim_date": "2023-12-01",
+    "rating": "Not Yet Rated",
+    "summary": "This specific claim hasn't been widely fact-checked yet. Remember to verify information from multiple credible sources before sharing."
+}
+
+_COVID_SNOPES_RESULT = {
+    "source": "Snopes",
+    "source_url": "https://www.snopes.com/fact-check/covid-vaccine-information/",
+    "title": "COVID-19 Vaccine Information",
+    "claim_date": "2023-08-15",
+    "rating": "Mixed",
+    "summary": "Various claims about COVID-19 vaccines have been examined with different ratings. Check the source for specific claim verification."
+}
+
+_COVID_REUTERS_RESULT = {
+    "source": "Reuters Fact Check",
+    "source_url": "https://www.reuters.com/fact-check/health-coronavirus",
+    "title": "COVID-19 and Vaccine Facts",
+    "claim_date": "2023-09-22",
+    "rating": "Fact-Based",
+    "summary": "Medical experts have confirmed that COVID-19 vaccines undergo rigorous safety testing and are effective at preventing severe illness."
+}
+
+_CLIMATE_FACTCHECK_RESULT = {
+    "source": "FactCheck.org",
+    "source_url": "https://www.factcheck.org/issue/climate-change/",
+    "title": "Climate Change Facts",
+    "claim_date": "2023-06-12",
+    "rating": "Fact-Based",
+    "summary": "Scientific consensus confirms that climate change is real and primarily caused by human activities. Individual claims may vary in accuracy."
+}
+
+_CLIMATE_HOAX_NASA_RESULT = {
+    "source": "NASA Climate",
+    "source_url": "https://climate.nasa.gov/evidence/",
+    "title": "Scientific Evidence for Climate Change",
+    "claim_date": "2023-04-18",
+    "rating": "False",
+    "summary": "Claims that climate change is a hoax are false. Multiple lines of evidence show Earth's climate is changing primarily due to human activities."
+}
+
+_ELECTION_FRAUD_POLITIFACT_RESULT = {
+    "source": "PolitiFact",
+    "source_url": "https://www.politifact.com/article/2022/nov/09/allegations-voter-fraud-dont-last/",
+    "title": "Claims of Widespread Election Fraud",
+    "claim_date": "2023-03-10",
+    "rating": "False",
+    "summary": "Multiple courts, election officials from both parties, and independent investigations have found no evidence of widespread voter fraud that could change election outcomes."
+}
+
+_ELECTION_POLITIFACT_RESULT = {
+    "source": "PolitiFact",
+    "source_url": "https://www.politifact.com/elections/",
+    "title": "Election Information Fact Checks",
+    "claim_date": "2023-05-10",
+    "rating": "Varies",
+    "summary": "Election-related claims are fact-checked on a case-by-case basis. Visit the source for specific claim verification."
+}
+
+_FIVE_G_FULLFACT_RESULT = {
+    "source": "Full Fact",
+    "source_url": "https://fullfact.org/health/5G-not-cause-coronavirus/",
+    "title": "5G and Health Claims",
+    "claim_date": "2023-02-15",
+    "rating": "False",
+    "summary": "Claims linking 5G technology to health problems or COVID-19 are not supported by scientific evidence. 5G radiation is non-ionizing and cannot damage cells or spread viruses."
+}
+
+_FLAT_EARTH_REUTERS_RESULT = {
+    "source": "Reuters Fact Check",
+    "source_url": "https://www.reuters.com/fact-check/earth-is-round",
+    "title": "Fact Check: The Earth is not flat",
+    "claim_date": "2023-02-18",
+    "rating": "False",
+    "summary": "The Earth has been scientifically proven to be roughly spherical. This fact has been confirmed by satellite imagery, circumnavigation, and various scientific measurements."
+}
+
+_FLAT_EARTH_NATGEO_RESULT = {
+    "source": "National Geographic",
+    "source_url": "https://www.nationalgeographic.com/science/article/how-we-know-earth-round-pancake-conspiracy",
+    "title": "How We Know Earth Is Round",
+    "claim_date": "2023-05-24",
+    "rating": "False",
+    "summary": "Multiple lines of evidence from different scientific fields all confirm that Earth is spherical, not flat. This includes direct observation, physics, and space photography."
+}
+
+_CHEMTRAILS_SNOPES_RESULT = {
+    "source": "Snopes",
+    "source_url": "https://www.snopes.com/fact-check/chemtrails/",
+    "title": "Fact Check: Chemtrails Conspiracy",
+    "claim_date": "2023-01-30",
+    "rating": "False",
+    "summary": "The 'chemtrails' conspiracy theory is false. The white lines in the sky behind aircraft are water vapor condensation trails (contrails), not chemical sprays for weather control or population management."
+}
+
+_MOON_LANDING_AP_RESULT = {
+    "source": "AP Fact Check",
+    "source_url": "https://apnews.com/article/fact-check-moon-landing-not-fake-apollo-5c6bc1ffe2f888c2b4b6768c0a4858f1",
+    "title": "Moon landings were real, not staged",
+    "claim_date": "2023-07-20",
+    "rating": "False",
+    "summary": "NASA's Apollo missions successfully landed astronauts on the moon six times between 1969 and 1972. The evidence includes moon rocks, photographs, independent verification from other countries, and ongoing observation of landing sites."
+}
+
+_ALT_MEDICINE_SBM_RESULT = {
+    "source": "Science-Based Medicine",
+    "source_url": "https://sciencebasedmedicine.org/alternative-medicine/",
+    "title": "Alternative Medicine Claims",
+    "claim_date": "2023-03-15",
+    "rating": "False",
+    "summary": "Many 'natural cures' lack scientific evidence of effectiveness and safety. While some natural products have medicinal properties, claims of miracle cures for serious diseases are typically unsupported by clinical research."
+}
+
+_VACCINE_MICROCHIP_FACTCHECK_RESULT = {
+    "source": "FactCheck.org",
+    "source_url": "https://www.factcheck.org/2021/03/scicheck-microchips-in-vaccines/",
+    "title": "No Microchips in Vaccines",
+    "claim_date": "2023-08-05",
+    "rating": "False",
+    "summary": "Vaccines do not contain microchips, tracking devices, or other surveillance technology. This claim has been thoroughly debunked by medical experts, regulatory bodies, and independent analysis of vaccine ingredients."
+}
+
 def verify_claim(claim_text: str) -> List[Dict[str, Any]]:
     """
     Verify a claim against multiple fact-checking sources.
@@ -39,24 +266,25 @@ def verify_claim(claim_text: str) -> List[Dict[str, Any]]:
     """
     results = []
     
+    # Scan the claim once for every topic the lookups below dispatch on
+    topics = detect_topics(claim_text)
+    
+    google_results = query_google_fact_check(claim_text, topics)
+    search_results = search_for_fact_checks(claim_text, topics)
+    
     # Try to get results from Google Fact Check API if we have an API key
-    if GOOGLE_API_KEY:
-        google_results = query_google_fact_check(claim_text)
-        if google_results:
-            results.extend(google_results)
+    if GOOGLE_API_KEY and google_results:
+        results.extend(google_results)
     
     # Always include search for fact checks regardless of previous results
     # This improves the variety of verification sources
-    search_results = search_for_fact_checks(claim_text)
     if search_results:
         results.extend(search_results)
     
     # Always check against the simulated Google Fact Check API results
     # even if we don't have results yet
-    if not GOOGLE_API_KEY:
-        more_results = query_google_fact_check(claim_text)
-        if more_results:
-            results.extend(more_results)
+    if not GOOGLE_API_KEY and google_results:
+        results.extend(google_results)
     
     # If we still have no results, check against news sources
     if not results:
@@ -66,47 +294,25 @@ def verify_claim(claim_text: str) -> List[Dict[str, Any]]:
     
     # If we couldn't find any verification results, provide topic-specific guidance
     if not results:
-        claim_lower = claim_text.lower()
-        
         # Health-related claims
-        if re.search(r"health|cure|disease|treatment|medicine|doctor|vaccine", claim_lower):
-            results.append({
-                "source": "National Institutes of Health",
-                "source_url": "https://www.nih.gov/health-information",
-                "title": "Health Information Resources",
-                "claim_date": "2023-11-10",
-                "rating": "Information",
-                "summary": "For health-related claims, consult medical professionals and reliable sources like NIH, CDC, or WHO. Medical information should be based on peer-reviewed research."
-            })
+        if "health" in topics:
+            results.append(_HEALTH_GUIDANCE_RESULT)
         # Political claims
-        elif re.search(r"(politic|government|election|democrat|republican|congress|senate|president)", claim_lower):
-            results.append({
-                "source": "AP Fact Check",
-                "source_url": "https://apnews.com/hub/ap-fact-check",
-                "title": "Political Claim Verification",
-                "claim_date": "2023-10-25",
-                "rating": "Analysis Needed",
-                "summary": "Political claims require careful verification through official government records, non-partisan analysis, and multiple reputable news sources."
-            })
+        elif "politics" in topics:
+            results.append(_POLITICS_GUIDANCE_RESULT)
         # Fallback for other topics
         else:
-            results.append({
-                "source": "Reuters Fact Check",
-                "source_url": "https://www.reuters.com/fact-check/",
-                "title": "Information Verification Guide",
-                "claim_date": "2023-12-01",
-                "rating": "Not Yet Rated",
-                "summary": "This specific claim hasn't been widely fact-checked yet. Remember to verify information from multiple credible sources before sharing."
-            })
+            results.append(_GENERAL_GUIDANCE_RESULT)
     
     return results
 
-def query_google_fact_check(claim_text: str) -> List[Dict[str, Any]]:
+def query_google_fact_check(claim_text: str, topics: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
     """
     Query the Google Fact Check Tools API for claim verification.
     
     Args:
         claim_text: The text of the claim to verify
+        topics: Topics already detected in the claim, computed if not given
         
     Returns:
         A list of verification results
@@ -123,13 +329,15 @@ def query_google_fact_check(claim_text: str) -> List[Dict[str, Any]]:
             logger.warning("No Google Fact Check API key provided. Skipping API query.")
             return []
         
-        # In a real implementation, this would be a real API call
+        # In a real implementation, this would be a real API call, importing
+        # requests here so workers that never call out don't load it
+        # import requests
         # params = {
         #     "key": GOOGLE_API_KEY,
         #     "query": claim_text,
         #     "languageCode": "en"
         # }
-        # response = requests.get(GOOGLE_FACT_CHECK_API_URL, params=params)
+        # response = requests.get(GOOGLE_FACT_CHECK_API_URL, params=params, timeout=10)
         # if response.status_code == 200:
         #     data = response.json()
         #     # Process the API response here
@@ -137,85 +345,36 @@ def query_google_fact_check(claim_text: str) -> List[Dict[str, Any]]:
         # For now, let's simulate some responses based on the claim text
         # This is just for demonstration purposes and would be replaced with real API calls
         
-        # Simulate a short delay like a real API call would have
-        time.sleep(0.5)
+        if topics is None:
+            topics = detect_topics(claim_text)
         
         # More sophisticated pattern matching for common misinformation topics
         # COVID and Vaccines
-        if re.search(r"vaccine|covid|coronavirus|pandemic", claim_text, re.IGNORECASE):
-            results.append({
-                "source": "Snopes",
-                "source_url": "https://www.snopes.com/fact-check/covid-vaccine-information/",
-                "title": "COVID-19 Vaccine Information",
-                "claim_date": "2023-08-15",
-                "rating": "Mixed",
-                "summary": "Various claims about COVID-19 vaccines have been examined with different ratings. Check the source for specific claim verification."
-            })
+        if "covid" in topics:
+            results.append(_COVID_SNOPES_RESULT)
             
             # Add a second source for better verification
-            results.append({
-                "source": "Reuters Fact Check",
-                "source_url": "https://www.reuters.com/fact-check/health-coronavirus",
-                "title": "COVID-19 and Vaccine Facts",
-                "claim_date": "2023-09-22",
-                "rating": "Fact-Based",
-                "summary": "Medical experts have confirmed that COVID-19 vaccines undergo rigorous safety testing and are effective at preventing severe illness."
-            })
+            results.append(_COVID_REUTERS_RESULT)
         
         # Climate Change
-        elif re.search(r"climate|global warming|carbon|emissions", claim_text, re.IGNORECASE):
-            results.append({
-                "source": "FactCheck.org",
-                "source_url": "https://www.factcheck.org/issue/climate-change/",
-                "title": "Climate Change Facts",
-                "claim_date": "2023-06-12",
-                "rating": "Fact-Based",
-                "summary": "Scientific consensus confirms that climate change is real and primarily caused by human activities. Individual claims may vary in accuracy."
-            })
+        elif "climate" in topics:
+            results.append(_CLIMATE_FACTCHECK_RESULT)
             
             # Add another climate source
-            if "hoax" in claim_text.lower() or "fake" in claim_text.lower():
-                results.append({
-                    "source": "NASA Climate",
-                    "source_url": "https://climate.nasa.gov/evidence/",
-                    "title": "Scientific Evidence for Climate Change",
-                    "claim_date": "2023-04-18",
-                    "rating": "False",
-                    "summary": "Claims that climate change is a hoax are false. Multiple lines of evidence show Earth's climate is changing primarily due to human activities."
-                })
+            if "hoax" in topics:
+                results.append(_CLIMATE_HOAX_NASA_RESULT)
         
         # Elections and Voting
-        elif re.search(r"election|voting|ballot|fraud", claim_text, re.IGNORECASE):
+        elif "election" in topics:
             # More specific election claims
-            if re.search(r"(stole|stolen|rigged|fraud|illegal votes)", claim_text, re.IGNORECASE):
-                results.append({
-                    "source": "PolitiFact",
-                    "source_url": "https://www.politifact.com/article/2022/nov/09/allegations-voter-fraud-dont-last/",
-                    "title": "Claims of Widespread Election Fraud",
-                    "claim_date": "2023-03-10",
-                    "rating": "False",
-                    "summary": "Multiple courts, election officials from both parties, and independent investigations have found no evidence of widespread voter fraud that could change election outcomes."
-                })
+            if "election_fraud" in topics:
+                results.append(_ELECTION_FRAUD_POLITIFACT_RESULT)
             else:
-                results.append({
-                    "source": "PolitiFact",
-                    "source_url": "https://www.politifact.com/elections/",
-                    "title": "Election Information Fact Checks",
-                    "claim_date": "2023-05-10",
-                    "rating": "Varies",
-                    "summary": "Election-related claims are fact-checked on a case-by-case basis. Visit the source for specific claim verification."
-                })
+                results.append(_ELECTION_POLITIFACT_RESULT)
                 
         # 5G misinformation
-        elif re.search(r"5G", claim_text) and re.search(r"(cause|spread|covid|health|radiation|danger)", claim_text, re.IGNORECASE):
-            results.append({
-                "source": "Full Fact",
-                "source_url": "https://fullfact.org/health/5G-not-cause-coronavirus/",
-                "title": "5G and Health Claims",
-                "claim_date": "2023-02-15",
-                "rating": "False",
-                "summary": "Claims linking 5G technology to health problems or COVID-19 are not supported by scientific evidence. 5G radiation is non-ionizing and cannot damage cells or spread viruses."
-            })
+        elif "5g" in topics and "5g_harm" in topics:
+            results.append(_FIVE_G_FULLFACT_RESULT)
             
         # No results found if none of the patterns match
         
@@ -224,12 +383,13 @@ def query_google_fact_check(claim_text: str) -> List[Dict[str, Any]]:
     
     return results
 
-def search_for_fact_checks(claim_text: str) -> List[Dict[str, Any]]:
+def search_for_fact_checks(claim_text: str, topics: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
     """
     Simulate searching for fact checks about the claim on various fact-checking websites.
     
     Args:
         claim_text: The text of the claim to verify
+        topics: Topics already detected in the claim, computed if not given
         
     Returns:
         A list of verification results
@@ -242,75 +402,33 @@ def search_for_fact_checks(claim_text: str) -> List[Dict[str, Any]]:
     # For demonstration purposes, we'll simulate some results based on the claim text
     # This is just to show how it would work and would be replaced with real searches
     
-    # Simulate a delay like a real search would have
-    time.sleep(0.8)
+    if topics is None:
+        topics = detect_topics(claim_text)
     
     # More comprehensive pattern matching for various misinformation topics
     
     # Flat Earth claims
-    if "flat earth" in claim_text.lower() or "earth is flat" in claim_text.lower():
-        results.append({
-            "source": "Reuters Fact Check",
-            "source_url": "https://www.reuters.com/fact-check/earth-is-round",
-            "title": "Fact Check: The Earth is not flat",
-            "claim_date": "2023-02-18",
-            "rating": "False",
-            "summary": "The Earth has been scientifically proven to be roughly spherical. This fact has been confirmed by satellite imagery, circumnavigation, and various scientific measurements."
-        })
+    if "flat_earth" in topics:
+        results.append(_FLAT_EARTH_REUTERS_RESULT)
         
         # Add a second source for stronger verification
-        results.append({
-            "source": "National Geographic",
-            "source_url": "https://www.nationalgeographic.com/science/article/how-we-know-earth-round-pancake-conspiracy",
-            "title": "How We Know Earth Is Round",
-            "claim_date": "2023-05-24",
-            "rating": "False",
-            "summary": "Multiple lines of evidence from different scientific fields all confirm that Earth is spherical, not flat. This includes direct observation, physics, and space photography."
-        })
+        results.append(_FLAT_EARTH_NATGEO_RESULT)
     
     # Chemtrails conspiracy
-    elif re.search(r"chemtrail|chem trail|chemical spray", claim_text, re.IGNORECASE):
-        results.append({
-            "source": "Snopes",
-            "source_url": "https://www.snopes.com/fact-check/chemtrails/",
-            "title": "Fact Check: Chemtrails Conspiracy",
-            "claim_date": "2023-01-30",
-            "rating": "False",
-            "summary": "The 'chemtrails' conspiracy theory is false. The white lines in the sky behind aircraft are water vapor condensation trails (contrails), not chemical sprays for weather control or population management."
-        })
+    elif "chemtrails" in topics:
+        results.append(_CHEMTRAILS_SNOPES_RESULT)
     
     # Moon landing hoax
-    elif re.search(r"moon landing (fake|hoax|staged)", claim_text, re.IGNORECASE) or "never went to the moon" in claim_text.lower():
-        results.append({
-            "source": "AP Fact Check",
-            "source_url": "https://apnews.com/article/fact-check-moon-landing-not-fake-apollo-5c6bc1ffe2f888c2b4b6768c0a4858f1",
-            "title": "Moon landings were real, not staged",
-            "claim_date": "2023-07-20",
-            "rating": "False",
-            "summary": "NASA's Apollo missions successfully landed astronauts on the moon six times between 1969 and 1972. The evidence includes moon rocks, photographs, independent verification from other countries, and ongoing observation of landing sites."
-        })
+    elif "moon_landing_hoax" in topics:
+        results.append(_MOON_LANDING_AP_RESULT)
     
     # Alternative Medicine/Anti-vaccine claims
-    elif re.search(r"(natural cure|essential oil|alternative medicine) (cure|treat|heal) (cancer|disease|illness)", claim_text, re.IGNORECASE):
-        results.append({
-            "source": "Science-Based Medicine",
-            "source_url": "https://sciencebasedmedicine.org/alternative-medicine/",
-            "title": "Alternative Medicine Claims",
-            "claim_date": "2023-03-15",
-            "rating": "False",
-            "summary": "Many 'natural cures' lack scientific evidence of effectiveness and safety. While some natural products have medicinal properties, claims of miracle cures for serious diseases are typically unsupported by clinical research."
-        })
+    elif "alternative_medicine" in topics:
+        results.append(_ALT_MEDICINE_SBM_RESULT)
     
     # Microchips in vaccines
-    elif re.search(r"(microchip|tracker|tracking device) (in|inside) (vaccine|vaccination)", claim_text, re.IGNORECASE):
-        results.append({
-            "source": "FactCheck.org",
-            "source_url": "https://www.factcheck.org/2021/03/scicheck-microchips-in-vaccines/",
-            "title": "No Microchips in Vaccines",
-            "claim_date": "2023-08-05",
-            "rating": "False",
-            "summary": "Vaccines do not contain microchips, tracking devices, or other surveillance technology. This claim has been thoroughly debunked by medical experts, regulatory bodies, and independent analysis of vaccine ingredients."
-        })
+    elif "vaccine_microchip" in topics:
+        results.append(_VACCINE_MICROCHIP_FACTCHECK_RESULT)
         
     return results
 
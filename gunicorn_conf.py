@@ -0,0 +1,25 @@
+import multiprocessing
+import os
+
+# Gunicorn settings for serving main:app, e.g. `gunicorn --config gunicorn_conf.py main:app`
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+
+# Several worker processes, each with a thread pool, so a slow /verify request
+# doesn't hold up the others
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# Keep idle client connections open briefly so browsers can reuse them
+keepalive = 5
+
+# Import the app once in the master, so the schema setup at import time runs a
+# single time instead of racing in every worker. Code changes then need a
+# restart, so the --reload dev workflow doesn't use this config.
+preload_app = True
+
+def post_fork(server, worker):
+    """Drop database connections inherited from the master; each worker opens its own."""
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -1,4 +1,10 @@
+import logging
+from dataclasses import dataclass
 from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import inspect, select, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.sql import func
 from app import db
 
 class Claim(db.Model):
@@ -7,7 +13,7 @@ class Claim(db.Model):
     text = db.Column(db.Text, nullable=False)
     ai_classification = db.Column(db.String(20), nullable=False)  # true, false, or unclear
     ai_confidence = db.Column(db.Float, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=func.now(), index=True)
     
     def __repr__(self):
         return f'<Claim {self.id}: {self.ai_classification}>'
@@ -15,13 +21,168 @@ class Claim(db.Model):
 class Source(db.Model):
     """Model to store sources used for verification."""
     id = db.Column(db.Integer, primary_key=True)
-    claim_id = db.Column(db.Integer, db.ForeignKey('claim.id'), nullable=False)
+    claim_id = db.Column(db.Integer, db.ForeignKey('claim.id'), nullable=False, index=True)
     url = db.Column(db.String(255), nullable=False)
     title = db.Column(db.String(255))
     source_type = db.Column(db.String(50))  # fact-check, news, etc.
     stance = db.Column(db.String(20))  # supports, refutes, or neutral
+    source_name = db.Column(db.String(100))  # e.g. Snopes, PolitiFact
+    claim_date = db.Column(db.String(20))
+    summary = db.Column(db.Text)
     
-    claim = db.relationship('Claim', backref=db.backref('sources', lazy=True))
+    claim = db.relationship('Claim', backref=db.backref('sources', lazy=True, order_by='Source.id'))
+    
+    @staticmethod
+    def row_from_verification_result(claim_id, result):
+        """Map one of the result dicts returned by verify_claim to Source column values."""
+        return {
+            "claim_id": claim_id,
+            "url": result["source_url"],
+            "title": result["title"],
+            "source_type": "fact-check",
+            "stance": result["rating"],
+            "source_name": result["source"],
+            "claim_date": result["claim_date"],
+            "summary": result["summary"],
+        }
     
     def __repr__(self):
         return f'<Source {self.id}: {self.stance}>'
+
+# Lightweight read-only views for rendering stored results. They are filled
+# from plain column rows, so no ORM identity map or attribute tracking is involved.
+
+@dataclass(slots=True)
+class ClaimView:
+    """A stored claim as shown on the results page."""
+    id: int
+    text: str
+    ai_classification: str
+    ai_confidence: float
+    created_at: Optional[datetime]
+
+@dataclass(slots=True)
+class SourceView:
+    """A stored source, with the same fields as a verify_claim result dict."""
+    source: str
+    source_url: str
+    title: str
+    claim_date: str
+    rating: str
+    summary: str
+
+def get_claim_view(claim_id: int) -> Optional[ClaimView]:
+    """Load a claim by id as a ClaimView, or None if it doesn't exist."""
+    row = db.session.execute(
+        select(Claim.id, Claim.text, Claim.ai_classification, Claim.ai_confidence, Claim.created_at)
+        .where(Claim.id == claim_id)
+    ).one_or_none()
+    return ClaimView(*row) if row is not None else None
+
+def get_source_views(claim_id: int) -> List[SourceView]:
+    """Load the sources of a claim as SourceViews, in the order they were stored."""
+    rows = db.session.execute(
+        select(Source.source_name, Source.url, Source.title, Source.claim_date, Source.stance, Source.summary)
+        .where(Source.claim_id == claim_id)
+        .order_by(Source.id)
+    )
+    return [SourceView(*row) for row in rows]
+
+def _column_names(table_name: str) -> List[str]:
+    """Return the column names a table currently has in the database."""
+    return [column["name"] for column in inspect(db.engine).get_columns(table_name)]
+
+def _index_names(table_name: str) -> List[str]:
+    """Return the index names a table currently has in the database."""
+    return [index["name"] for index in inspect(db.engine).get_indexes(table_name)]
+
+def _apply_schema_step(description: str, statement, is_applied):
+    """
+    Run one schema change in its own transaction, tolerating a concurrent upgrade.
+    
+    Another process may make the same change between our check and the DDL. Its
+    "already exists" error is ignored once the live schema shows the change.
+    
+    Args:
+        description: What the step does, for the log
+        statement: Callable taking a connection and executing the change
+        is_applied: Callable returning True once the change is in the database
+    """
+    logging.info(description)
+    try:
+        with db.engine.begin() as connection:
+            statement(connection)
+    except (OperationalError, ProgrammingError):
+        if not is_applied():
+            raise
+        logging.info(f"{description}: already done by another process")
+
+def upgrade_schema():
+    """
+    Bring tables created by older versions of the app up to date.
+    
+    db.create_all only creates missing tables, so columns, defaults and
+    indexes added to existing models since are applied here. Every step checks
+    the live schema first and tolerates another process applying it at the
+    same time, so this is safe to run on every start.
+    """
+    dialect = db.engine.dialect
+    
+    # Source columns that hold the fields of a verify_claim result
+    source_columns = _column_names(Source.__tablename__)
+    for column in (Source.__table__.c.source_name, Source.__table__.c.claim_date, Source.__table__.c.summary):
+        if column.name not in source_columns:
+            ddl = text(f"ALTER TABLE {Source.__tablename__} ADD COLUMN {column.name} {column.type.compile(dialect=dialect)}")
+            _apply_schema_step(
+                f"Adding column {Source.__tablename__}.{column.name}",
+                lambda connection, ddl=ddl: connection.execute(ddl),
+                lambda name=column.name: name in _column_names(Source.__tablename__),
+            )
+    
+    # Claim.created_at used to be a naive UTC time filled in by Python; it now
+    # needs a database default, and on PostgreSQL a time zone aware column
+    claim_columns = {column["name"]: column for column in inspect(db.engine).get_columns(Claim.__tablename__)}
+    created_at = claim_columns["created_at"]
+    if dialect.name == "postgresql":
+        if created_at["default"] is None or not getattr(created_at["type"], "timezone", False):
+            with db.engine.begin() as connection:
+                # Lock first and re-check, so a concurrent start can't convert the times twice
+                connection.execute(text("LOCK TABLE claim IN ACCESS EXCLUSIVE MODE"))
+                data_type = connection.execute(text(
+                    "SELECT data_type FROM information_schema.columns "
+                    "WHERE table_schema = current_schema() AND table_name = 'claim' AND column_name = 'created_at'"
+                )).scalar()
+                if data_type == "timestamp without time zone":
+                    logging.info("Converting claim.created_at to timestamptz")
+                    connection.execute(text(
+                        "ALTER TABLE claim ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC'"
+                    ))
+                logging.info("Adding a database default to claim.created_at")
+                connection.execute(text("ALTER TABLE claim ALTER COLUMN created_at SET DEFAULT now()"))
+    elif created_at["default"] is None:
+        if dialect.name == "sqlite":
+            # SQLite can't change a column default in place, so fill it in after insert
+            with db.engine.begin() as connection:
+                has_trigger = connection.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'claim_created_at_default'"
+                )).first()
+                if not has_trigger:
+                    logging.info("Adding a trigger to set claim.created_at")
+                    connection.execute(text(
+                        "CREATE TRIGGER IF NOT EXISTS claim_created_at_default "
+                        "AFTER INSERT ON claim FOR EACH ROW WHEN NEW.created_at IS NULL "
+                        "BEGIN UPDATE claim SET created_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END"
+                    ))
+        else:
+            logging.warning(f"claim.created_at has no database default; add one for the {dialect.name} database")
+    
+    # Indexes on claim_id and created_at
+    for table in (Claim.__table__, Source.__table__):
+        indexes = _index_names(table.name)
+        for index in table.indexes:
+            if index.name not in indexes:
+                _apply_schema_step(
+                    f"Creating index {index.name}",
+                    index.create,
+                    lambda index=index: index.name in _index_names(index.table.name),
+                )
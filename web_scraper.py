@@ -1,13 +1,240 @@
+import asyncio
+import codecs
+from dataclasses import dataclass
+import html
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Union
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import logging
-from urllib.parse import urlparse
 import trafilatura
+from trafilatura.utils import decode_file
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# How long downloaded pages are served from the disk cache, in seconds
+PAGE_CACHE_EXPIRY = 86400
+
+# Largest page body read from a site, in bytes; anything longer is truncated
+MAX_PAGE_BYTES = 512 * 1024
+
+class _CappedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that reads at most MAX_PAGE_BYTES of each response body.
+    
+    The body is streamed and reading stops at the cap, so a huge or endless
+    page costs neither the memory nor the transfer time of the full download.
+    The headers, rating and claim markup sit well within the first 512 KB.
+    Reading happens here rather than after session.get(stream=True) because
+    the cache stores whatever body the adapter hands back.
+    
+    The body is always read before the response is returned, so stream=True
+    has no effect on a session using this adapter: iter_content and
+    response.raw only ever see the capped content.
+    """
+    
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        try:
+            try:
+                response._content = resp.read(MAX_PAGE_BYTES, decode_content=True)
+                truncated = bool(resp.read(1, decode_content=True))
+            except Urllib3HTTPError as e:
+                # A body that failed part-way leaves the connection unusable
+                resp.close()
+                raise requests.exceptions.ConnectionError(e, request=req) from e
+            response._content_consumed = True
+            if truncated:
+                # The rest of the body is still on the wire, so the connection
+                # cannot be reused for another request
+                logger.warning(f"Truncated response from {req.url} at {MAX_PAGE_BYTES} bytes")
+                resp.close()
+        finally:
+            resp.release_conn()
+        return response
+
+def _build_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all downloads.
+    
+    Connections are pooled per host and kept alive, so repeated requests to the
+    same fact-checking site skip DNS, TCP and TLS setup. Transient failures are
+    retried with a short backoff.
+    
+    Response bodies are capped at MAX_PAGE_BYTES. They are cached on disk in
+    scraper_cache.sqlite for a day. Once an
+    entry expires it is revalidated with a conditional GET (If-None-Match /
+    If-Modified-Since), so unchanged pages are not downloaded again.
+    """
+    session = requests_cache.CachedSession(
+        "scraper_cache",
+        expire_after=PAGE_CACHE_EXPIRY,
+        allowable_methods=("GET",),
+    )
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = _CappedAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    return session
+
+# Shared HTTP session for downloading articles
+SESSION = _build_session()
+
+# Connect and read timeouts, in seconds
+REQUEST_TIMEOUT = (5, 15)
+
+def _marker_xpath(class_names: Iterable[str]) -> etree.XPath:
+    """
+    Compile an XPath selecting every element whose class mentions any of the given CSS classes.
+    
+    All of a site's markers are found in a single walk over the tree. The plain
+    contains() test is much cheaper than matching whole class tokens in XPath,
+    but it also matches longer names such as "rating-label-extra", so callers
+    check the class tokens of the few elements it returns.
+    """
+    tests = " or ".join(f"contains(@class, '{class_name}')" for class_name in class_names)
+    return etree.XPath(f"//*[{tests}]")
+
+# Text of an element with whitespace collapsed, done by lxml rather than in Python
+_NORMALIZED_TEXT_XP = etree.XPath("normalize-space(.)", smart_strings=False)
+
+def _extract_markers(tree, xpath: etree.XPath, fields: Dict[str, str]) -> Dict[str, str]:
+    """
+    Fill each field from the text of the first element carrying its CSS class.
+    
+    Args:
+        tree: The parsed article
+        xpath: A _marker_xpath over the keys of fields
+        fields: Mapping of CSS class name to result field name
+        
+    Returns:
+        A dictionary with every field name, set to "" when its class is not found
+    """
+    result = dict.fromkeys(fields.values(), "")
+    found = set()
+    for element in xpath(tree):
+        for class_name in element.get("class", "").split():
+            field = fields.get(class_name)
+            if field and field not in found:
+                found.add(field)
+                result[field] = _NORMALIZED_TEXT_XP(element)
+        if len(found) == len(fields):
+            break
+    return result
+
+# Matches the page title in raw HTML, for pages without a site-specific parser.
+# Only the start of the page is searched, since <title> sits in the <head>.
+_TITLE_RE = re.compile(rb"<title[^>]*>([^<]{0,512})</title>", re.IGNORECASE)
+_TITLE_SCAN_BYTES = 16384
+
+# XPath expressions for the fields pulled from fact-checking pages, compiled once
+_TITLE_XP = etree.XPath("string((//title)[1])")
+_SNOPES_FIELDS = {"rating-label": "rating", "claim-text": "claim"}
+_SNOPES_MARKERS_XP = _marker_xpath(_SNOPES_FIELDS)
+_POLITIFACT_FIELDS = {"meter-label": "rating", "statement__text": "claim"}
+_POLITIFACT_MARKERS_XP = _marker_xpath(_POLITIFACT_FIELDS)
+
+def _title_from_bytes(content: bytes, encoding: Optional[str]) -> str:
+    """
+    Pull the <title> out of raw HTML without building a DOM, or "" if there is none.
+    
+    The title is decoded with the given encoding, or guessed by trafilatura when
+    the response did not declare one.
+    """
+    match = _TITLE_RE.search(content, 0, _TITLE_SCAN_BYTES)
+    if not match:
+        return ""
+    title = match.group(1).decode(encoding, errors="replace") if encoding else decode_file(match.group(1))
+    return html.unescape(title).strip()
+
+def _extract_snopes(tree) -> Dict[str, str]:
+    """Extract the rating and claim from a parsed Snopes article."""
+    return _extract_markers(tree, _SNOPES_MARKERS_XP, _SNOPES_FIELDS)
+
+def _extract_politifact(tree) -> Dict[str, str]:
+    """Extract the rating and claim from a parsed PolitiFact article."""
+    return _extract_markers(tree, _POLITIFACT_MARKERS_XP, _POLITIFACT_FIELDS)
+
+# Captures the charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r"""charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+
+def _declared_charset(response: requests.Response) -> Optional[str]:
+    """
+    Return the charset named in the response's Content-Type header, or None.
+    
+    response.encoding can't be used for this: requests reports ISO-8859-1 for
+    any text/* response without a charset, which would misread UTF-8 pages.
+    Unknown charset names count as undeclared.
+    """
+    match = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    if not match:
+        return None
+    try:
+        return codecs.lookup(match.group(1)).name
+    except LookupError:
+        return None
+
+def _decode_declared(content: bytes, charset: Optional[str]) -> Union[bytes, str]:
+    """
+    Decode a body with its declared charset for trafilatura, which never sees the headers.
+    
+    Without a declared charset the raw bytes are returned for trafilatura to decode.
+    """
+    return content.decode(charset, errors="replace") if charset else content
+
+def _parse_page(content: bytes, charset: Optional[str]) -> Optional[lxml.html.HtmlElement]:
+    """
+    Parse a downloaded page into an lxml tree, or None if it isn't HTML.
+    
+    lxml only looks for a <meta charset> in the bytes, so a page that declares
+    its encoding in the Content-Type header alone would come out garbled. A
+    declared charset is handed to the parser; otherwise trafilatura guesses the
+    encoding and parses the decoded text, as it does for raw bytes.
+    """
+    if charset:
+        return lxml.html.fromstring(content, parser=lxml.html.HTMLParser(encoding=charset))
+    return trafilatura.load_html(content)
+
+# Captures the host of an http(s) URL, without any leading "www."
+_HOST_RE = re.compile(r"https?://(?:[^/?#@]*@)?(?:www\.)?([^/?#:]+)", re.IGNORECASE)
+
+def _site_host(url: str) -> str:
+    """Return the lowercased host used to look up SITE_EXTRACTORS, or "" if the URL has none."""
+    match = _HOST_RE.match(url)
+    return match.group(1).lower() if match else ""
+
+# Site-specific extractors keyed by host name without a leading "www."
+# Add more site-specific parsers as needed
+SITE_EXTRACTORS: Dict[str, Callable[..., Dict[str, str]]] = {
+    "snopes.com": _extract_snopes,
+    "politifact.com": _extract_politifact,
+}
+
+def _extract_text(html: Union[bytes, str, lxml.html.HtmlElement], url: str) -> str:
+    """
+    Extract the main text from already-downloaded HTML, or "" if there is none.
+    
+    Raw response bytes are preferred over requests' response.text: trafilatura
+    decodes them itself (with cchardet when installed), which avoids the slower
+    pure-Python encoding detection. A body whose charset the response declared
+    is passed already decoded, and a page that has already been parsed can be
+    passed as an lxml tree; trafilatura leaves it intact.
+    """
+    text = trafilatura.extract(html, url=url)
+    if not text:
+        logger.warning(f"Failed to extract text from {url}")
+        return ""
+    return text
+
 def get_website_text_content(url: str) -> str:
     """
     This function takes a url and returns the main text content of the website.
@@ -20,23 +247,28 @@ def get_website_text_content(url: str) -> str:
         A string containing the main text content of the website
     """
     try:
-        # Send a request to the website
-        downloaded = trafilatura.fetch_url(url)
-        if not downloaded:
+        # Send a request to the website through the cached session
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        if not response.ok or not response.content:
             logger.warning(f"Failed to download content from {url}")
             return ""
             
-        text = trafilatura.extract(downloaded)
-        if not text:
-            logger.warning(f"Failed to extract text from {url}")
-            return ""
-            
-        return text
+        return _extract_text(_decode_declared(response.content, _declared_charset(response)), url)
     except Exception as e:
         logger.error(f"Error scraping website {url}: {e}")
         return ""
 
-def fetch_fact_check_article(url: str) -> dict:
+@dataclass(slots=True)
+class FactCheck:
+    """Information extracted from a fact-checking article."""
+    url: str
+    title: str = ""
+    content: str = ""
+    rating: str = ""
+    claim: str = ""
+    date: str = ""
+
+def fetch_fact_check_article(url: str) -> FactCheck:
     """
     Fetch a fact-checking article and extract relevant information.
     
@@ -44,55 +276,94 @@ def fetch_fact_check_article(url: str) -> dict:
         url: The URL of the fact-checking article
         
     Returns:
-        A dictionary containing information about the fact-check
+        A FactCheck containing information about the fact-check
     """
-    result = {
-        "url": url,
-        "title": "",
-        "content": "",
-        "rating": "",
-        "claim": "",
-        "date": "",
-    }
+    result = FactCheck(url=url)
     
     try:
-        # Get the domain to determine which parser to use
-        domain = urlparse(url).netloc
+        # Get the host to determine which parser to use
+        host = _site_host(url)
+        
+        # Download the page once and reuse it for both extraction steps
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        if not response.ok or not response.content:
+            logger.warning(f"Failed to download fact-check article from {url}")
+            return result
+        
+        # Only build a DOM when a site-specific parser needs one. The tree is
+        # then shared with trafilatura, which works on its own copy of it,
+        # so the page is parsed once rather than twice.
+        extractor = SITE_EXTRACTORS.get(host)
+        charset = _declared_charset(response)
+        if extractor:
+            page = _parse_page(response.content, charset)
+        else:
+            page = _decode_declared(response.content, charset)
+        if page is None:
+            return result
         
         # Get the full text content
-        result["content"] = get_website_text_content(url)
+        result.content = _extract_text(page, url)
         
-        # Use Beautiful Soup for more targeted extraction if needed
-        response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Nothing usable came back, so skip the remaining extraction
+        if not result.content:
+            return result
         
-        # Extract the title
-        result["title"] = soup.title.text.strip() if soup.title else ""
+        if not extractor:
+            result.title = _title_from_bytes(response.content, charset)
+            return result
         
-        # Extract rating and other information based on the domain
-        if "snopes.com" in domain:
-            # Extract Snopes-specific information
-            rating_elem = soup.select_one(".rating-label")
-            if rating_elem:
-                result["rating"] = rating_elem.text.strip()
-                
-            claim_elem = soup.select_one(".claim-text")
-            if claim_elem:
-                result["claim"] = claim_elem.text.strip()
-                
-        elif "politifact.com" in domain:
-            # Extract PolitiFact-specific information
-            rating_elem = soup.select_one(".meter-label")
-            if rating_elem:
-                result["rating"] = rating_elem.text.strip()
-                
-            claim_elem = soup.select_one(".statement__text")
-            if claim_elem:
-                result["claim"] = claim_elem.text.strip()
+        # Extract the title
+        result.title = _TITLE_XP(page).strip()
         
-        # Add more site-specific parsers as needed
+        # Extract rating and other information based on the site
+        for field, value in extractor(page).items():
+            setattr(result, field, value)
                 
     except Exception as e:
         logger.error(f"Error parsing fact-check article {url}: {e}")
     
     return result
+
+def fetch_fact_check_articles(urls: List[str], max_workers: int = 16) -> List[FactCheck]:
+    """
+    Fetch several fact-checking articles concurrently from a thread pool.
+    
+    Each download spends most of its time waiting on the network, so running
+    them side by side on the shared session cuts the total time for a batch
+    of N articles to roughly N / max_workers round-trips. The session's
+    connection pool is larger than max_workers, so threads never wait for a
+    free connection.
+    
+    Args:
+        urls: The URLs of the fact-checking articles
+        max_workers: The maximum number of articles fetched at the same time
+        
+    Returns:
+        A list of FactCheck results in the same order as urls
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scraper") as executor:
+        return list(executor.map(fetch_fact_check_article, urls))
+
+async def fetch_fact_check_articles_async(urls: List[str], concurrency: int = 20) -> List[FactCheck]:
+    """
+    Fetch several fact-checking articles concurrently from async code.
+    
+    Each article is fetched and parsed by fetch_fact_check_article in a worker
+    thread, so downloads overlap and the event loop stays free while pages are
+    parsed. At most `concurrency` articles are in flight at once.
+    
+    Args:
+        urls: The URLs of the fact-checking articles
+        concurrency: The maximum number of articles fetched at the same time
+        
+    Returns:
+        A list of FactCheck results in the same order as urls
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch(url: str) -> FactCheck:
+        async with semaphore:
+            return await asyncio.to_thread(fetch_fact_check_article, url)
+    
+    return await asyncio.gather(*(fetch(url) for url in urls))